@@ -33,13 +33,13 @@ __all__ = [
 ###############################################################################
 
 # Keep track of all allowed methods
-DDS_METHODS = ["put", "get", "ls", "rm", "create", "add"]
+DDS_METHODS = frozenset(["put", "get", "ls", "rm", "create", "add"])
 
 # Methods to which a directory created by DDS
-DDS_DIR_REQUIRED_METHODS = ["put", "get"]
+DDS_DIR_REQUIRED_METHODS = frozenset(["put", "get"])
 
 # Methods which require a project ID
-DDS_KEYS_REQUIRED_METHODS = ["put", "get"]
+DDS_KEYS_REQUIRED_METHODS = frozenset(["put", "get"])
 
 # Token related variables
 TOKEN_FILE = pathlib.Path(os.path.expanduser("~/.dds_cli_token"))
@@ -55,6 +55,8 @@ TOKEN_WARNING_AGE = datetime.timedelta(days=1, hours=18)
 class DDSEndpoint:
     """Defines all DDS urls."""
 
+    __slots__ = ()
+
     # Base url - local or remote
     BASE_ENDPOINT_LOCAL = "http://127.0.0.1:5000/api/v1"
     BASE_ENDPOINT_REMOTE = "https://dds.dckube.scilifelab.se/api/v1"
@@ -107,6 +109,8 @@ class DDSEndpoint:
 class FileSegment:
     """Defines information on signatures, file chunks, etc."""
 
+    __slots__ = ()
+
     DDS_SIGNATURE = b"DelSys"
     SEGMENT_SIZE_RAW = 65536  # Size of chunk to read from raw file
     SEGMENT_SIZE_CIPHER = SEGMENT_SIZE_RAW + 16  # Size of chunk to read from encrypted file
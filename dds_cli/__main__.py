@@ -580,83 +580,96 @@ def get(
         sys.exit(1)
 
     # Begin delivery
-    with dds_cli.data_getter.DataGetter(
-        username=username,
-        project=project,
-        get_all=get_all,
-        source=source,
-        source_path_file=source_path_file,
-        break_on_fail=break_on_fail,
-        destination=destination,
-        silent=silent,
-        verify_checksum=verify_checksum,
-        no_prompt=click_ctx.get("NO_PROMPT", False),
-    ) as getter:
-
-        with rich.progress.Progress(
-            "{task.description}",
-            rich.progress.BarColumn(bar_width=None),
-            " • ",
-            "[progress.percentage]{task.percentage:>3.1f}%",
-            refresh_per_second=2,
-            console=dds_cli.utils.console,
-        ) as progress:
-
-            # Keep track of futures
-            download_threads = {}
-
-            # Iterator to keep track of which files have been handled
-            iterator = iter(getter.filehandler.data.copy())
-
-            with concurrent.futures.ThreadPoolExecutor() as texec:
-                task_dwnld = progress.add_task(
-                    "Download", total=len(getter.filehandler.data), step="summary"
-                )
-
-                # Schedule the first num_threads futures for upload
-                for file in itertools.islice(iterator, num_threads):
-                    LOG.info(f"Starting: {file}")
-                    # Execute download
-                    download_threads[
-                        texec.submit(getter.download_and_verify, file=file, progress=progress)
-                    ] = file
-
-                while download_threads:
-                    # Wait for the next future to complete
-                    ddone, _ = concurrent.futures.wait(
-                        download_threads, return_when=concurrent.futures.FIRST_COMPLETED
+    try:
+        with dds_cli.data_getter.DataGetter(
+            username=username,
+            project=project,
+            get_all=get_all,
+            source=source,
+            source_path_file=source_path_file,
+            break_on_fail=break_on_fail,
+            destination=destination,
+            silent=silent,
+            verify_checksum=verify_checksum,
+            no_prompt=click_ctx.get("NO_PROMPT", False),
+        ) as getter:
+
+            with rich.progress.Progress(
+                "{task.description}",
+                rich.progress.BarColumn(bar_width=None),
+                " • ",
+                "[progress.percentage]{task.percentage:>3.1f}%",
+                refresh_per_second=2,
+                console=dds_cli.utils.console,
+            ) as progress:
+
+                # Keep track of futures
+                download_threads = {}
+
+                # Iterator to keep track of which files have been handled
+                iterator = iter(getter.filehandler.data.copy())
+
+                with concurrent.futures.ThreadPoolExecutor() as texec:
+                    task_dwnld = progress.add_task(
+                        "Download", total=len(getter.filehandler.data), step="summary"
                     )
 
-                    new_tasks = 0
+                    # Schedule the first num_threads futures for upload
+                    for file in itertools.islice(iterator, num_threads):
+                        LOG.info("Starting: %s", file)
+                        # Execute download
+                        download_threads[
+                            texec.submit(getter.download_and_verify, file=file, progress=progress)
+                        ] = file
 
-                    for dfut in ddone:
-                        downloaded_file = download_threads.pop(dfut)
-                        LOG.info(
-                            f"Future done: {downloaded_file}",
+                    while download_threads:
+                        # Wait for the next future to complete
+                        ddone, _ = concurrent.futures.wait(
+                            download_threads, return_when=concurrent.futures.FIRST_COMPLETED
                         )
 
-                        # Get result
-                        try:
-                            file_downloaded = dfut.result()
-                            LOG.info(f"Download of {downloaded_file} successful: {file_downloaded}")
-                        except concurrent.futures.BrokenExecutor as err:
-                            LOG.critical(f"Download of file {downloaded_file} failed! Error: {err}")
-                            continue
-
-                        new_tasks += 1
-                        progress.advance(task_dwnld)
-
-                    # Schedule the next set of futures for download
-                    for next_file in itertools.islice(iterator, new_tasks):
-                        LOG.info(f"Starting: {next_file}")
-                        # Execute download
-                        download_threads[
-                            texec.submit(
-                                getter.download_and_verify,
-                                file=next_file,
-                                progress=progress,
+                        new_tasks = 0
+
+                        for dfut in ddone:
+                            downloaded_file = download_threads.pop(dfut)
+                            LOG.info(
+                                f"Future done: {downloaded_file}",
                             )
-                        ] = next_file
+
+                            # Get result
+                            try:
+                                file_downloaded = dfut.result()
+                                LOG.info(
+                                    "Download of %s successful: %s",
+                                    downloaded_file,
+                                    file_downloaded,
+                                )
+                            except concurrent.futures.BrokenExecutor as err:
+                                LOG.critical(
+                                    f"Download of file {downloaded_file} failed! Error: {err}"
+                                )
+                                continue
+
+                            new_tasks += 1
+                            progress.advance(task_dwnld)
+
+                        # Schedule the next set of futures for download
+                        for next_file in itertools.islice(iterator, new_tasks):
+                            LOG.info("Starting: %s", next_file)
+                            # Execute download
+                            download_threads[
+                                texec.submit(
+                                    getter.download_and_verify,
+                                    file=next_file,
+                                    progress=progress,
+                                )
+                            ] = next_file
+    except (dds_cli.exceptions.NoDataError) as err:
+        LOG.warning(err)
+        sys.exit(0)
+    except (dds_cli.exceptions.APIError, dds_cli.exceptions.AuthenticationError) as err:
+        LOG.error(err)
+        sys.exit(1)
 
 
 ###################################################################################
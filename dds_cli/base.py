@@ -5,15 +5,15 @@
 ###############################################################################
 
 # Standard library
+import concurrent.futures
 import logging
-import os
 import pathlib
+import threading
 
 # Installed
 import http
 import requests
 import rich
-import simplejson
 
 # Own modules
 import dds_cli.directory
@@ -87,6 +87,7 @@ class DDSBaseClass:
         self.stop_doing = False
 
         # Authenticate the user and get the token
+        self.session = None
         if authenticate:
             dds_user = user.User(
                 username=username,
@@ -95,6 +96,13 @@ class DDSBaseClass:
             )
             self.token = dds_user.token_dict
 
+            # Reuse one TCP/TLS connection pool for all API calls in this invocation
+            self.session = requests.Session()
+            self.session.headers.update(self.token)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
         LOG.debug(f"Method: {self.method}, Project: {self.project}")
         # Project access only required if trying to upload, download or list
         # files within project
@@ -102,6 +110,8 @@ class DDSBaseClass:
             self.keys = self.__get_project_keys()
 
             self.status = dict()
+            # Guards cross-file status updates from the delivery worker threads
+            self.status_lock = threading.Lock()
             self.filehandler = None
 
     def __enter__(self):
@@ -110,6 +120,9 @@ class DDSBaseClass:
 
     def __exit__(self, exc_type, exc_value, tb, max_fileerrs: int = 40):
         """Finish and print out delivery summary."""
+        if self.session is not None:
+            self.session.close()
+
         if self.method in ["put", "get"]:
             self.__printout_delivery_summary()
 
@@ -123,23 +136,26 @@ class DDSBaseClass:
     # Private methods ############################### Private methods #
     def __get_project_keys(self):
         """Get public and private project keys depending on method."""
-        # Project public key required for both put and get
-        public = self.__get_key()
+        # Project private only required for get -- fetch both keys concurrently
+        # since the two API calls are independent
+        if self.method == "get":
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                public_future = executor.submit(self.__get_key)
+                private = self.__get_key(private=True)
+                public = public_future.result()
+            return private, public
 
-        # Project private only required for get
-        private = self.__get_key(private=True) if self.method == "get" else None
-
-        return private, public
+        # Project public key required for both put and get
+        return None, self.__get_key()
 
     def __get_key(self, private: bool = False):
         """Get public key for project."""
         key_type = "private" if private else "public"
         # Get key from API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.PROJ_PRIVATE if private else DDSEndpoint.PROJ_PUBLIC,
                 params={"project": self.project},
-                headers=self.token,
                 timeout=DDSEndpoint.TIMEOUT,
             )
         except requests.exceptions.RequestException as err:
@@ -151,25 +167,33 @@ class DDSBaseClass:
             if response.status_code == http.HTTPStatus.INTERNAL_SERVER_ERROR:
                 raise exceptions.ApiResponseError(message=f"{message}: {response.reason}")
 
-            raise exceptions.DDSCLIException(message=f"{message}: {response.json().get('message')}")
+            raise exceptions.DDSCLIException(
+                message=f"{message}: {dds_cli.utils.get_json_response(response).get('message')}"
+            )
 
         # Get key from response
         try:
-            project_public = response.json()
-        except simplejson.JSONDecodeError as err:
+            project_public = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             LOG.fatal(str(err))
             raise SystemExit from err
 
-        if key_type not in project_public:
-            dds_cli.utils.console.print(
-                "\n:no_entry_sign: Project access denied: No {key_type} key. :no_entry_sign:\n"
+        key = project_public.get(key_type)
+        if key is None:
+            raise exceptions.DDSCLIException(
+                message=f":no_entry_sign: Project access denied: No {key_type} key. :no_entry_sign:"
             )
-            os._exit(1)
 
-        return project_public[key_type]
+        return key
 
     def __printout_delivery_summary(self, max_fileerrs: int = 40):
         """Print out the delivery summary if any files were cancelled."""
+        # Nothing was processed or failed -- no summary to collect or print.
+        # data alone is not enough: files rejected up front (e.g. already
+        # uploaded) are moved out of data into failed and still need the table
+        if self.filehandler is None or not (self.filehandler.data or self.filehandler.failed):
+            return
+
         any_failed = self.__collect_all_failed()
 
         # Clear dict to not take up too much space
@@ -184,16 +208,21 @@ class DDSBaseClass:
             if len(any_failed) < max_fileerrs:
                 dds_cli.utils.console.print(f"{intro_error_message}:")
 
+                # Partition once instead of letting each table filter the full set
+                root_failed, folders_failed = [], []
+                for entry in any_failed:
+                    (root_failed if entry[1]["subpath"] == "." else folders_failed).append(entry)
+
                 # Cancelled files in root
                 files_table, additional_info = fh.FileHandler.create_summary_table(
-                    all_failed_data=any_failed, upload=bool(self.method == "put")
+                    all_failed_data=root_failed, upload=bool(self.method == "put")
                 )
                 if files_table is not None:
                     dds_cli.utils.console.print(rich.padding.Padding(files_table, 1))
 
                 # Cancelled files in different folders
                 folders_table, additional_info = fh.FileHandler.create_summary_table(
-                    all_failed_data=any_failed,
+                    all_failed_data=folders_failed,
                     get_single_files=False,
                     upload=bool(self.method == "put"),
                 )
@@ -206,7 +235,7 @@ class DDSBaseClass:
                 f"{intro_error_message}. See {self.failed_delivery_log} for more information."
             )
 
-            if any([y["failed_op"] in ["add_file_db"] for _, y in self.status.items()]):
+            if any(y["failed_op"] == "add_file_db" for y in self.status.values()):
                 dds_cli.utils.console.print(
                     rich.padding.Padding(
                         "One or more files where uploaded but may not have been added to "
@@ -225,35 +254,24 @@ class DDSBaseClass:
 
     def __collect_all_failed(self, sort: bool = True):
         """Put cancelled files from status in to failed dict and sort the output."""
-        # Transform all items to string
-        self.filehandler.data = {
-            str(file): {str(x): str(y) for x, y in info.items()}
-            for file, info in list(self.filehandler.data.items())
-        }
-        self.status = {
-            str(file): {str(x): str(y) for x, y in info.items()}
-            for file, info in list(self.status.items())
-        }
-
-        # Get cancelled files
+        # Only the cancelled files end up in the summary -- stringify just
+        # those instead of rebuilding both dicts
+        data = self.filehandler.data
         self.filehandler.failed.update(
             {
-                file: {
-                    **info,
-                    "message": self.status[file]["message"],
-                    "failed_op": self.status[file]["failed_op"],
+                str(file): {
+                    **{str(x): str(y) for x, y in data[file].items()},
+                    "message": str(file_status["message"]),
+                    "failed_op": str(file_status["failed_op"]),
                 }
-                for file, info in self.filehandler.data.items()
-                if self.status[file]["cancel"] in [True, "True"]
+                for file, file_status in self.status.items()
+                if file_status["cancel"] and file in data
             }
         )
 
         # Sort by which directory the files are in
         return (
-            sorted(
-                sorted(self.filehandler.failed.items(), key=lambda g: g[0]),
-                key=lambda f: f[1]["subpath"],
-            )
+            sorted(self.filehandler.failed.items(), key=lambda f: (f[1]["subpath"], f[0]))
             if sort
             else self.filehandler.failed
         )
@@ -265,9 +283,15 @@ class DDSBaseClass:
 
         with s3.S3Connector(project_id=self.project, token=self.token) as conn:
 
-            if None in [conn.safespring_project, conn.keys, conn.bucketname, conn.url]:
-                dds_cli.utils.console.print(f"\n:warning-emoji: {conn.message} :warning-emoji:\n")
-                os._exit(1)
+            if (
+                conn.safespring_project is None
+                or conn.keys is None
+                or conn.bucketname is None
+                or conn.url is None
+            ):
+                raise exceptions.DDSCLIException(
+                    message=f":warning-emoji: {conn.message} :warning-emoji:"
+                )
 
             bucket_exists = conn.check_bucket_exists()
             LOG.debug(f"Bucket exists: {bucket_exists}")
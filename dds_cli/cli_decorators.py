@@ -28,6 +28,31 @@ import dds_cli.file_handler
 
 LOG = logging.getLogger(__name__)
 
+# Methods that the update_status decorator can wrap
+_STATUS_METHODS = frozenset(["put", "add_file_db", "get", "update_db"])
+
+###############################################################################
+# FUNCTIONS ####################################################### FUNCTIONS #
+###############################################################################
+
+
+@functools.lru_cache(maxsize=8)
+def _cloud_resource(url, access_key, secret_key):
+    """Create the S3 resource for the given endpoint and credentials.
+
+    boto3 session construction redoes credential resolution and service model
+    loading every time; the resource holds no per-call state (only its
+    thread-safe meta.client is used), so one per endpoint and key pair is
+    reused for the process lifetime."""
+    session = boto3.session.Session()
+    return session.resource(
+        service_name="s3",
+        endpoint_url=url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+    )
+
+
 ###############################################################################
 # DECORATORS ##################################################### DECORATORS #
 ###############################################################################
@@ -37,47 +62,54 @@ def verify_proceed(func):
     """Decorator for verifying that the file is not cancelled.
     Also cancels the upload of all non-started files if break-on-fail."""
 
+    name = func.__name__
+
     @functools.wraps(func)
     def wrapped(self, file, *args, **kwargs):
 
         # Check if keyboardinterrupt in dds
         if self.stop_doing:
             # TODO (ina): Add save to status here
-            message = "KeyBoardInterrupt - cancelling file {file}"
-            LOG.warning(message)
+            LOG.warning("KeyBoardInterrupt - cancelling file %s", file)
             return False  # Do not proceed
 
+        file_status = self.status[file]
+
         # Return if file cancelled by another file
-        if self.status[file]["cancel"]:
-            message = f"File already cancelled, stopping file {file}"
-            LOG.warning(message)
-            return False
+        with self.status_lock:
+            if file_status["cancel"]:
+                LOG.warning("File already cancelled, stopping file %s", file)
+                return False
 
-        # Mark as started
-        self.status[file]["started"] = True
-        LOG.info(f"File {file} started {func.__name__}")
+            # Mark as started
+            file_status["started"] = True
+            self.not_started.discard(file)
+        LOG.info("File %s started %s", file, name)
 
         # Run function
         ok_to_proceed, message = func(self, file=file, *args, **kwargs)
 
         # Cancel file(s) if something failed
         if not ok_to_proceed:
-            LOG.warning(f"{func.__name__} failed: {message}")
-            self.status[file].update({"cancel": True, "message": message})
-            if self.status[file].get("failed_op") is None:
-                self.status[file]["failed_op"] = "crypto"
-
-            if self.break_on_fail:
-                message = f"'--break-on-fail'. File causing failure: '{file}'. "
-                LOG.info(message)
-
-                _ = [
-                    self.status[x].update({"cancel": True, "message": message})
-                    for x in self.status
-                    if not self.status[x]["cancel"] and not self.status[x]["started"] and x != file
-                ]
+            LOG.warning("%s failed: %s", name, message)
+            with self.status_lock:
+                file_status.update({"cancel": True, "message": message})
+                if file_status.get("failed_op") is None:
+                    file_status["failed_op"] = "crypto"
+
+                if self.break_on_fail:
+                    message = f"'--break-on-fail'. File causing failure: '{file}'. "
+                    LOG.info(message)
+
+                    # Cancel all files that have not been started yet
+                    for x in self.not_started:
+                        x_status = self.status[x]
+                        if not x_status["cancel"]:
+                            x_status["cancel"] = True
+                            x_status["message"] = message
+                    self.not_started.clear()
             dds_cli.file_handler.FileHandler.append_errors_to_file(
-                self.failed_delivery_log, self.status[file]
+                self.failed_delivery_log, file_status
             )
         return ok_to_proceed
 
@@ -87,18 +119,23 @@ def verify_proceed(func):
 def update_status(func):
     """Decorator for updating the status of files."""
 
+    # TODO (ina): add processing?
+    name = func.__name__
+    if name not in _STATUS_METHODS:
+        raise Exception(f"The function {name} cannot be used with this decorator.")
+    started_key = f"{name}_started"
+    done_key = f"{name}_done"
+
     @functools.wraps(func)
     def wrapped(self, file, *args, **kwargs):
 
-        # TODO (ina): add processing?
-        if func.__name__ not in ["put", "add_file_db", "get", "update_db"]:
-            raise Exception(f"The function {func.__name__} cannot be used with this decorator.")
-        if func.__name__ not in self.status[file]:
-            raise Exception(f"No status found for function {func.__name__}.")
+        file_status = self.status[file]
+        if started_key not in file_status:
+            raise Exception(f"No status found for function {name}.")
 
         # Update status to started
-        self.status[file][func.__name__].update({"started": True})
-        LOG.debug(f"File {file} status updated to {func.__name__}: started")
+        file_status[started_key] = True
+        LOG.debug("File %s status updated to %s: started", file, name)
 
         # Run function
         ok_to_continue, message, *_ = func(self, file=file, *args, **kwargs)
@@ -107,13 +144,13 @@ def update_status(func):
         if not ok_to_continue:
             # Save info about which operation failed
 
-            self.status[file]["failed_op"] = func.__name__
-            LOG.warning(f"{func.__name__} failed: {message}")
+            file_status["failed_op"] = name
+            LOG.warning("%s failed: %s", name, message)
 
         else:
             # Update status to done
-            self.status[file][func.__name__].update({"done": True})
-            LOG.debug(f"File {file} status updated to {func.__name__}: done")
+            file_status[done_key] = True
+            LOG.debug("File %s status updated to %s: done", file, name)
 
         return ok_to_continue, message
 
@@ -128,13 +165,10 @@ def connect_cloud(func):
 
         # Connect to service
         try:
-            session = boto3.session.Session()
-
-            self.resource = session.resource(
-                service_name="s3",
-                endpoint_url=self.url,
-                aws_access_key_id=self.keys["access_key"],
-                aws_secret_access_key=self.keys["secret_key"],
+            self.resource = _cloud_resource(
+                url=self.url,
+                access_key=self.keys["access_key"],
+                secret_key=self.keys["secret_key"],
             )
         except (boto3.exceptions.Boto3Error, botocore.exceptions.BotoCoreError) as err:
             self.url, self.keys, self.message = (
@@ -157,18 +191,19 @@ def subpath_required(func):
         """Create the sub directory if it does not exist."""
 
         file_info = self.filehandler.data[file]
+        subpath = str(file_info["subpath"])
 
-        # Required path
-        full_subpath = self.filehandler.local_destination / pathlib.Path(file_info["subpath"])
-
-        # Create path
-        if not full_subpath.exists():
+        # Create path -- mkdir is idempotent, no need to stat first. Subpaths
+        # already created during this run skip the syscall entirely.
+        if subpath not in self.filehandler.created_subpaths:
+            full_subpath = self.filehandler.local_destination / pathlib.Path(subpath)
             try:
                 full_subpath.mkdir(parents=True, exist_ok=True)
             except OSError as err:
                 return False, str(err)
 
-            LOG.info(f"New directory created: {full_subpath}")
+            self.filehandler.created_subpaths.add(subpath)
+            LOG.debug("Directory created or already exists: %s", full_subpath)
 
         return func(self, file=file, *args, **kwargs)
 
@@ -214,11 +249,13 @@ def removal_spinner(func):
         if self.failed_table is not None:
             table_len = self.failed_table.renderable.row_count
 
-            if table_len + 5 > dds_cli.utils.console.height:
-                with dds_cli.utils.console.pager():
-                    dds_cli.utils.console.print(self.failed_table)
+            # Read the terminal height once
+            console = dds_cli.utils.console
+            if table_len + 5 > console.height:
+                with console.pager():
+                    console.print(self.failed_table)
             else:
-                dds_cli.utils.console.print(self.failed_table)
+                console.print(self.failed_table)
             LOG.warning(f"Finished {description_lc} with errors, see table above")
         else:
             LOG.info(f"Successfully finished {description_lc}")
@@ -6,18 +6,17 @@
 
 # Standard library
 import logging
-import os
 import pathlib
 
 # Installed
 import boto3
 import botocore
 import requests
-import simplejson
 from rich.progress import Progress, SpinnerColumn
 
 # Own modules
 from dds_cli import DDSEndpoint
+from dds_cli import exceptions
 from dds_cli import file_handler_remote as fhr
 from dds_cli import data_remover as dr
 from dds_cli import file_compressor as fc
@@ -75,10 +74,7 @@ class DataGetter(base.DDSBaseClass):
 
         # Only method "get" can use the DataGetter class
         if self.method != "get":
-            dds_cli.utils.console.print(
-                f"\n:no_entry_sign: Unauthorized method: {self.method} :no_entry_sign:\n"
-            )
-            os._exit(1)
+            raise exceptions.AuthenticationError(f"Unauthorized method: '{self.method}'")
 
         # Start file prep progress
         with Progress(
@@ -90,25 +86,29 @@ class DataGetter(base.DDSBaseClass):
             self.filehandler = fhr.RemoteFileHandler(
                 get_all=get_all,
                 user_input=(source, source_path_file),
-                token=self.token,
+                session=self.session,
                 project=self.project,
                 destination=self.dds_directory.directories["FILES"],
             )
 
             if self.filehandler.failed and self.break_on_fail:
-                dds_cli.utils.console.print(
-                    "\n:warning-emoji: Some specified files were not found in the system "
-                    "and '--break-on-fail' flag used. :warning-emoji:\n\n"
-                    f"Files not found: {self.filehandler.failed}\n"
+                raise exceptions.DDSCLIException(
+                    message=(
+                        "Some specified files were not found in the system "
+                        "and '--break-on-fail' flag used. "
+                        f"Files not found: {self.filehandler.failed}"
+                    )
                 )
-                os._exit(1)
 
             if not self.filehandler.data:
-                dds_cli.utils.console.print("\nNo files to download.\n")
-                os._exit(0)
+                raise exceptions.NoDataError("No files to download.")
 
             self.status = self.filehandler.create_download_status_dict()
 
+            # Index of files not yet started -- lets break-on-fail cancel
+            # pending files without rescanning the whole status dict
+            self.not_started = set(self.status)
+
             progress.remove_task(wait_task)
 
     # Public methods ############ Public methods #
@@ -136,13 +136,13 @@ class DataGetter(base.DDSBaseClass):
             total=file_info["size_original"],
         )
 
-        LOG.debug(f"File {file} downloaded: {file_downloaded}")
+        LOG.debug("File %s downloaded: %s", file, file_downloaded)
 
         if file_downloaded:
             db_updated, message = self.update_db(file=file)
-            LOG.debug(f"Database updated: {db_updated}")
+            LOG.debug("Database updated: %s", db_updated)
 
-            LOG.info(f"Beginning decryption of file {file}...")
+            LOG.info("Beginning decryption of file %s...", file)
             file_saved = False
             with fe.Decryptor(
                 project_keys=self.keys,
@@ -163,7 +163,7 @@ class DataGetter(base.DDSBaseClass):
                     outfile=file,
                 )
 
-            LOG.debug(f"file saved? {file_saved}")
+            LOG.debug("file saved? %s", file_saved)
             if file_saved:
                 # TODO (ina): decide on checksum verification method --
                 # this checks original, the other is generated from compressed
@@ -183,12 +183,13 @@ class DataGetter(base.DDSBaseClass):
         """Download files from the cloud."""
         downloaded = False
         error = ""
-        file_local = str(self.filehandler.data[file]["path_downloaded"])
-        file_remote = self.filehandler.data[file]["name_in_bucket"]
+        file_info = self.filehandler.data[file]
+        file_local = str(file_info["path_downloaded"])
+        file_remote = file_info["name_in_bucket"]
 
         with s3.S3Connector(project_id=self.project, token=self.token) as conn:
 
-            if None in [conn.url, conn.keys, conn.bucketname]:
+            if conn.url is None or conn.keys is None or conn.bucketname is None:
                 error = "No s3 info returned! " + conn.message
             else:
                 # Upload file
@@ -206,7 +207,7 @@ class DataGetter(base.DDSBaseClass):
                     boto3.exceptions.Boto3Error,
                 ) as err:
                     error = f"S3 download of file '{file}' failed: {err}"
-                    LOG.exception(f"{file}: {err}")
+                    LOG.exception("%s: %s", file, err)
                 else:
                     downloaded = True
 
@@ -238,8 +239,8 @@ class DataGetter(base.DDSBaseClass):
             return updated_in_db, error
 
         try:
-            updated_in_db, error = (True, response.json()["message"])
-        except simplejson.JSONDecodeError as err:
+            updated_in_db, error = (True, dds_cli.utils.get_json_response(response)["message"])
+        except dds_cli.utils.JSONDecodeError as err:
             raise SystemExit from err
 
         return updated_in_db, error
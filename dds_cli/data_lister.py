@@ -5,14 +5,13 @@
 ###############################################################################
 
 # Standard library
-from dataclasses import dataclass
+import concurrent.futures
 import logging
 import os
-from typing import Tuple, Union, List
+from typing import Tuple, List
 
 # Installed
 import requests
-import simplejson
 from rich.padding import Padding
 from rich.table import Table
 from rich.tree import Tree
@@ -31,6 +30,9 @@ from dds_cli import text_handler as th
 
 LOG = logging.getLogger(__name__)
 
+# Shared column format defaults -- read-only, never mutated
+_DEFAULT_FORMAT = {"justify": "left", "style": "", "footer": "", "overflow": "fold"}
+
 ###############################################################################
 # CLASSES ########################################################### CLASSES #
 ###############################################################################
@@ -84,37 +86,42 @@ class DataLister(base.DDSBaseClass):
             LOG.warning(f"Can only sort by {sort_by} when using the --usage flag.")
             sort_by = "updated"
 
-        # Sort according to ID
-        sorted_projects = sorted(projects, key=lambda i: i["Project ID"])
-
-        # Sort again according to chosen of default option
+        # Column title to sort by -- unknown options fall back to ID only
         sort_by = sorting_dict.get(sort_by)
-        if sort_by:
-            sorted_projects = sorted(
+        if not sort_by or sort_by == sorting_dict["id"]:
+            return sorted(projects, key=lambda i: i["Project ID"])
+
+        if sort_by == sorting_dict["updated"]:
+            # Reversed sort -- keep the stable two-pass so that equal dates
+            # stay in ascending ID order
+            sorted_projects = sorted(projects, key=lambda i: i["Project ID"])
+            return sorted(
                 sorted_projects,
                 key=lambda t: (t[sort_by] is None, t[sort_by]),
-                reverse=sort_by == sorting_dict.get("updated"),
+                reverse=True,
             )
 
-        return sorted_projects
+        # The ID pre-sort only acts as a tie breaker -- fold it into one sort
+        # with a composite key
+        return sorted(projects, key=lambda t: (t[sort_by] is None, t[sort_by], t["Project ID"]))
 
     def format_columns(self, total_size=None, usage_info=None):
         """Define the formatting for the project table according to what is returned from API."""
-        default_format = {"justify": "left", "style": "", "footer": "", "overflow": "fold"}
-
-        # Choose formattting
+        # Footers are only rendered with --usage -- skip formatting them otherwise
         column_formatting = {
             "Project ID": {
-                "justify": default_format.get("justify"),
+                "justify": _DEFAULT_FORMAT.get("justify"),
                 "style": "green",
-                "footer": "Total" if self.show_usage else default_format.get("footer"),
-                "overflow": default_format.get("overflow"),
+                "footer": "Total" if self.show_usage else _DEFAULT_FORMAT.get("footer"),
+                "overflow": _DEFAULT_FORMAT.get("overflow"),
             },
-            **{x: default_format for x in ["Title", "PI", "Status", "Last updated"]},
+            **{x: _DEFAULT_FORMAT for x in ["Title", "PI", "Status", "Last updated"]},
             "Size": {
                 "justify": "right",
-                "style": default_format.get("style"),
-                "footer": dds_cli.utils.format_api_response(total_size, key="Size"),
+                "style": _DEFAULT_FORMAT.get("style"),
+                "footer": dds_cli.utils.format_api_response(total_size, key="Size")
+                if self.show_usage
+                else _DEFAULT_FORMAT.get("footer"),
                 "overflow": "ellipsis",
             },
         }
@@ -125,7 +132,7 @@ class DataLister(base.DDSBaseClass):
                 {
                     "Usage": {
                         "justify": "right",
-                        "style": default_format.get("style"),
+                        "style": _DEFAULT_FORMAT.get("style"),
                         "footer": dds_cli.utils.format_api_response(
                             usage_info["usage"], key="Usage"
                         ),
@@ -133,7 +140,7 @@ class DataLister(base.DDSBaseClass):
                     },
                     "Cost": {
                         "justify": "right",
-                        "style": default_format.get("style"),
+                        "style": _DEFAULT_FORMAT.get("style"),
                         "footer": dds_cli.utils.format_api_response(usage_info["cost"], key="Cost"),
                         "overflow": "ellipsis",
                     },
@@ -146,9 +153,8 @@ class DataLister(base.DDSBaseClass):
         """Get a list of project(s) the user is involved in."""
         # Get projects from API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.LIST_PROJ,
-                headers=self.token,
                 params={
                     "usage": self.show_usage,
                     "project": self.project,
@@ -163,8 +169,8 @@ class DataLister(base.DDSBaseClass):
 
         # Get result from API
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             raise exceptions.APIError(f"Could not decode JSON response: {err}")
 
         # Cancel if user not involved in any projects
@@ -207,23 +213,23 @@ class DataLister(base.DDSBaseClass):
         # calculate the magnitudes for keeping the unit prefix constant across all projects
         magnitudes = dds_cli.utils.calculate_magnitude(sorted_projects, column_formatting.keys())
 
-        # Add all column values for each row to table
+        # Add all column values for each row to table -- pair each column with
+        # its magnitude once instead of per row
+        column_magnitudes = [(colname, magnitudes[colname]) for colname in column_formatting]
+        format_api_response = dds_cli.utils.format_api_response
         for proj in sorted_projects:
-            table.add_row(
-                *[
-                    dds_cli.utils.format_api_response(proj[i], i, magnitudes[i])
-                    for i in column_formatting
-                ]
-            )
+            table.add_row(*(format_api_response(proj[c], c, m) for c, m in column_magnitudes))
 
         # Print to stdout if there are any lines
         if table.columns:
-            # Use a pager if output is taller than the visible terminal
-            if len(sorted_projects) + 5 > dds_cli.utils.console.height:
-                with dds_cli.utils.console.pager():
-                    dds_cli.utils.console.print(table)
+            # Use a pager if output is taller than the visible terminal --
+            # read the terminal height once
+            console = dds_cli.utils.console
+            if len(sorted_projects) + 5 > console.height:
+                with console.pager():
+                    console.print(table)
             else:
-                dds_cli.utils.console.print(table)
+                console.print(table)
         else:
             raise exceptions.NoDataError("No projects found.")
 
@@ -238,11 +244,10 @@ class DataLister(base.DDSBaseClass):
 
         # Make call to API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.LIST_FILES,
                 params={"project": self.project},
                 json={"subpath": folder, "show_size": show_size},
-                headers=self.token,
             )
         except requests.exceptions.RequestException as err:
             raise exceptions.APIError(f"Problem with database response: '{err}'")
@@ -252,12 +257,12 @@ class DataLister(base.DDSBaseClass):
 
         # Get response
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             raise exceptions.APIError(f"Could not decode JSON response: '{err}'")
 
         # Check if project empty
-        if "num_items" in resp_json and resp_json["num_items"] == 0:
+        if resp_json.get("num_items") == 0:
             raise exceptions.NoDataError(f"Project '{self.project}' is empty.")
 
         # Get files
@@ -273,26 +278,21 @@ class DataLister(base.DDSBaseClass):
         if not sorted_files_folders:
             raise exceptions.NoDataError(f"Could not find folder: '{folder}'")
 
-        # Get max length of file name
-        max_string = max([len(x["name"]) for x in sorted_files_folders])
-
-        # Get max length of size string
-        max_size = max(
-            [
-                len(x["size"].split(" ")[0])
-                for x in sorted_files_folders
-                if show_size and "size" in x
-            ],
-            default=0,
-        )
+        # Get max length of file name and of size number in a single pass
+        max_string = 0
+        max_size = 0
+        for x in sorted_files_folders:
+            max_string = max(max_string, len(x["name"]))
+            if show_size and "size" in x:
+                max_size = max(max_size, len(x["size"].split(" ")[0]))
 
         # Visible folders
         visible_folders = []
 
         # Add items to tree
         for x in sorted_files_folders:
-            # Check if string is folder
-            is_folder = x.pop("folder")
+            # Check if string is folder -- read, don't mutate the parsed dict
+            is_folder = x["folder"]
 
             # Att 1 for folders due to trailing /
             tab = th.TextHandler.format_tabs(
@@ -309,21 +309,23 @@ class DataLister(base.DDSBaseClass):
 
             # Add size to line if option specified
             if show_size and "size" in x:
-                line += f"{tab}{x['size'].split()[0]}"
+                size_number, size_unit = x["size"].split(" ", 1)
+                line += f"{tab}{size_number}"
 
                 # Define space between number and size format
                 tabs_bf_format = th.TextHandler.format_tabs(
                     string_len=len(x["size"]), max_string_len=max_size, tab_len=2
                 )
-                line += f"{tabs_bf_format}{x['size'].split()[1]}"
+                line += f"{tabs_bf_format}{size_unit}"
             tree.add(line)
 
-        # Print output to stdout
-        if len(files_folders) + 5 > dds_cli.utils.console.height:
-            with dds_cli.utils.console.pager():
-                dds_cli.utils.console.print(Padding(tree, 1))
+        # Print output to stdout -- read the terminal height once
+        console = dds_cli.utils.console
+        if len(files_folders) + 5 > console.height:
+            with console.pager():
+                console.print(Padding(tree, 1))
         else:
-            dds_cli.utils.console.print(Padding(tree, 1))
+            console.print(Padding(tree, 1))
 
         # Return variable
         return visible_folders
@@ -331,124 +333,140 @@ class DataLister(base.DDSBaseClass):
     def list_recursive(self, show_size: bool = False):
         """Recursively list project contents."""
 
-        @dataclass
-        class FileTree:
-            """Container class for holding information about the remote file tree."""
-
-            subtrees: List[Union["FileTree", Tuple[str, str]]] = None
-            name: str = None
-
-        def _construct_file_tree(folder: str, basename: str) -> Tuple[FileTree, int, int]:
-            """
-            Recurses through the project directories.
-
-            Constructs a file tree by subsequent calls to the API
-            """
-            # Make call to API
+        def _fetch_folder(folder: str) -> List[dict]:
+            """Get the sorted listing of one folder from the API."""
             try:
-                resp_json = requests.get(
+                response = self.session.get(
                     DDSEndpoint.LIST_FILES,
                     params={"project": self.project},
                     json={"subpath": folder, "show_size": show_size},
-                    headers=self.token,
                 )
             except requests.exceptions.RequestException as err:
                 raise exceptions.APIError(f"Problem with database response: '{err}'")
 
-            resp_json = resp_json.json()
-            tree = FileTree([], f"{basename}/")
-            sorted_files_folders = sorted(resp_json["files_folders"], key=lambda f: f["name"])
+            resp_json = dds_cli.utils.get_json_response(response)
+            return sorted(resp_json["files_folders"], key=lambda f: f["name"])
+
+        def _fetch_all_folders() -> dict:
+            """Fetch the listings of all project folders, level by level.
+
+            The folders on each level are independent, so they are requested
+            in parallel over the pooled session; the result maps each folder
+            to its sorted listing."""
+            listings = {}
+            current_level = [None]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+                while current_level:
+                    for folder, listing in zip(
+                        current_level, executor.map(_fetch_folder, current_level)
+                    ):
+                        listings[folder] = listing
+
+                    current_level = [
+                        os.path.join(folder, f["name"]) if folder else f["name"]
+                        for folder in current_level
+                        for f in listings[folder]
+                        if f["folder"]
+                    ]
+
+            return listings
+
+        def _compute_widths() -> Tuple[int, int]:
+            """Compute the max name and size-number widths over all listings.
+
+            Names are adjusted for the 4-character rich indentation per
+            directory level so the size column lines up across the tree."""
+            max_string = 0
+            max_size = 0
+            for folder, listing in listings.items():
+                # Indentation depth of the entries in this folder
+                depth = _depths[folder]
+                for x in listing:
+                    max_string = max(max_string, len(x["name"]) + 4 * depth)
+                    if show_size and "size" in x:
+                        max_size = max(max_size, len(x["size"].split(" ", 1)[0]))
+
+            return max_string, max_size
+
+        def _construct_rich_tree(folder: str, basename: str, depth: int) -> Tuple[Tree, int]:
+            """Construct the rich tree for one folder from the prefetched listings."""
+            tree = Tree(f"{basename}/")
+            sorted_files_folders = listings[folder]
 
             if not sorted_files_folders:
                 raise exceptions.NoDataError(f"Could not find folder: '{folder}'")
 
-            # Get max length of file name
-            max_string = max([len(x["name"]) for x in sorted_files_folders])
-
-            # Get max length of size string
-            max_size = max(
-                [
-                    len(x["size"].split(" ")[0])
-                    for x in sorted_files_folders
-                    if show_size and "size" in x
-                ],
-                default=0,
-            )
+            # Pre-bind hot lookups -- locals instead of attribute probes per line
+            tree_add = tree.add
+            format_tabs = th.TextHandler.format_tabs
+            name_width = max_string - 4 * depth
+
             # Rich outputs precisely one line per file/folder
+            tree_length = len(sorted_files_folders)
             for f in sorted_files_folders:
-                is_folder = f.pop("folder")
-
-                if not is_folder:
-                    tree.subtrees.append((f["name"], f.get("size") if show_size else None))
-                else:
-                    subtree, _max_string, _max_size = _construct_file_tree(
+                if f["folder"]:
+                    subtree, length = _construct_rich_tree(
                         os.path.join(folder, f["name"]) if folder else f["name"],
                         f"[bold deep_sky_blue3]{f['name']}",
+                        depth + 1,
                     )
-                    # Due to indentation, the filename strings of
-                    # subdirectories are 4 characters deeper than
-                    # their parent directories
-                    max_string = max(max_string, _max_string + 4)
-                    max_size = max(max_size, _max_size)
-                    tree.subtrees.append(subtree)
-
-            return tree, max_string, max_size
-
-        def _construct_rich_tree(
-            file_tree: FileTree, max_str: int, max_size: int, depth: int
-        ) -> Tuple[Tree, int]:
-            """Construct the rich tree from the file tree."""
-            tree = Tree(file_tree.name)
-            tree_length = len(file_tree.subtrees)
-            for node in file_tree.subtrees:
-                if isinstance(node, FileTree):
-                    subtree, length = _construct_rich_tree(node, max_str, max_size, depth + 1)
-                    tree.add(subtree)
+                    tree_add(subtree)
                     tree_length += length
                 else:
-                    line = node[0]
-                    if show_size and node[1] is not None:
-                        tab = th.TextHandler.format_tabs(
-                            string_len=len(node[0]),
-                            max_string_len=max_str - 4 * depth,
+                    line = f["name"]
+                    size = f.get("size") if show_size else None
+                    if size is not None:
+                        size_number, size_unit = size.split(" ", 1)
+                        tab = format_tabs(
+                            string_len=len(line),
+                            max_string_len=name_width,
                         )
-                        line += f"{tab}{node[1].split()[0]}"
+                        line += f"{tab}{size_number}"
 
                         # Define space between number and size format
-                        tabs_bf_format = th.TextHandler.format_tabs(
-                            string_len=len(node[1].split()[1]),
+                        tabs_bf_format = format_tabs(
+                            string_len=len(size_unit),
                             max_string_len=max_size,
                             tab_len=2,
                         )
-                        line += f"{tabs_bf_format}{node[1].split()[1]}"
-                    tree.add(line)
+                        line += f"{tabs_bf_format}{size_unit}"
+                    tree_add(line)
 
             return tree, tree_length
 
-        # We use two tree walks, one for file search and one for Rich tree
-        # constructing, since it is difficult to compute the correct size
-        # indentation without the whole tree
-        file_tree, max_string, max_size = _construct_file_tree(
-            None, f"[bold magenta]Files & directories in project: [green]{self.project}"
-        )
+        # Fetch every folder listing up front -- the traversal itself is then
+        # pure local work
+        listings = _fetch_all_folders()
+
+        # Indentation depth per folder, known from the prefetch order
+        _depths = {}
+        for folder in listings:
+            _depths[folder] = 0 if folder is None else _depths[os.path.dirname(folder) or None] + 1
 
-        tree, tree_length = _construct_rich_tree(file_tree, max_string, max_size, 0)
+        # The size-column alignment needs the global widths, so compute them
+        # over the prefetched listings before the single rendering walk
+        max_string, max_size = _compute_widths()
+
+        tree, tree_length = _construct_rich_tree(
+            None, f"[bold magenta]Files & directories in project: [green]{self.project}", 0
+        )
 
         # The first header is not accounted for by the recursion
         tree_length += 1
 
         # Check if the tree is t0o large to be printed directly
-        # and use a pager if that is the case
-        if tree_length > dds_cli.utils.console.height:
-            with dds_cli.utils.console.pager():
-                dds_cli.utils.console.print(
+        # and use a pager if that is the case -- read the terminal height once
+        console = dds_cli.utils.console
+        if tree_length > console.height:
+            with console.pager():
+                console.print(
                     Padding(
                         tree,
                         1,
                     )
                 )
         else:
-            dds_cli.utils.console.print(
+            console.print(
                 Padding(
                     tree,
                     1,
@@ -459,9 +477,8 @@ class DataLister(base.DDSBaseClass):
         """Get a list of user(s) involved in a project."""
         # Get user list from API
         try:
-            response = requests.get(
+            response = self.session.get(
                 DDSEndpoint.LIST_PROJ_USERS,
-                headers=self.token,
                 params={
                     "project": self.project,
                 },
@@ -475,8 +492,8 @@ class DataLister(base.DDSBaseClass):
 
         # Get result from API
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             raise exceptions.APIError(f"Could not decode JSON response: {err}")
 
         research_users = resp_json.get("research_users")
@@ -500,17 +517,20 @@ class DataLister(base.DDSBaseClass):
             )
 
         # Add all column values for each row to table
+        column_names = list(column_formatting)
         for user in research_users:
-            table.add_row(*[user[i] for i in column_formatting])
+            table.add_row(*(user[i] for i in column_names))
 
         # Print to stdout if there are any lines
         if table.rows:
-            # Use a pager if output is taller than the visible terminal
-            if len(research_users) + 5 > dds_cli.utils.console.height:
-                with dds_cli.utils.console.pager():
-                    dds_cli.utils.console.print(table)
+            # Use a pager if output is taller than the visible terminal --
+            # read the terminal height once
+            console = dds_cli.utils.console
+            if len(research_users) + 5 > console.height:
+                with console.pager():
+                    console.print(table)
             else:
-                dds_cli.utils.console.print(table)
+                console.print(table)
         else:
             raise exceptions.NoDataError("No users found.")
 
@@ -6,6 +6,7 @@
 
 # Standard library
 import concurrent.futures
+import functools
 import itertools
 import logging
 import pathlib
@@ -13,13 +14,14 @@ import pathlib
 # Installed
 import boto3
 import botocore
+from boto3.s3.transfer import TransferConfig
 import requests
 from rich.progress import Progress, SpinnerColumn, BarColumn
-import simplejson
 
 # Own modules
 from dds_cli import base
 from dds_cli import exceptions
+from dds_cli import FileSegment
 from dds_cli import data_remover as dr
 from dds_cli import DDSEndpoint
 from dds_cli import file_encryptor as fe
@@ -38,6 +40,21 @@ import dds_cli.utils
 
 LOG = logging.getLogger(__name__)
 
+# Multipart upload settings -- uploads parts of large files in parallel. The
+# chunk size is a multiple of SEGMENT_SIZE_CIPHER so that encrypted file
+# chunks align with the part boundaries.
+UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=256 * FileSegment.SEGMENT_SIZE_CIPHER,
+    max_concurrency=10,
+)
+
+# Constant upload arguments, shared by all files -- never mutated
+UPLOAD_EXTRA_ARGS = {
+    "ACL": "private",  # Access control list
+    "CacheControl": "no-store",  # Don't store cache
+}
+
 ###############################################################################
 # MAIN FUNCTION ############################################### MAIN FUNCTION #
 ###############################################################################
@@ -92,7 +109,7 @@ def put(
 
                 # Schedule the first num_threads futures for upload
                 for file in itertools.islice(iterator, num_threads):
-                    LOG.info(f"Starting: {file}")
+                    LOG.info("Starting: %s", file)
                     upload_threads[
                         texec.submit(
                             putter.protect_and_upload,
@@ -116,12 +133,14 @@ def put(
                         # Get result from future and schedule database update
                         for fut in done:
                             uploaded_file = upload_threads.pop(fut)
-                            LOG.debug(f"Future done for file: {uploaded_file}")
+                            LOG.debug("Future done for file: %s", uploaded_file)
 
                             # Get result
                             try:
                                 file_uploaded = fut.result()
-                                LOG.debug(f"Upload of {uploaded_file} successful: {file_uploaded}")
+                                LOG.debug(
+                                    "Upload of %s successful: %s", uploaded_file, file_uploaded
+                                )
                             except concurrent.futures.BrokenExecutor as err:
                                 LOG.error(f"Upload of file {uploaded_file} failed! Error: {err}")
                                 continue
@@ -134,7 +153,7 @@ def put(
 
                         # Schedule the next set of futures for upload
                         for next_file in itertools.islice(iterator, new_tasks):
-                            LOG.info(f"Starting: {next_file}")
+                            LOG.info("Starting: %s", next_file)
                             upload_threads[
                                 texec.submit(
                                     putter.protect_and_upload,
@@ -156,10 +175,9 @@ def put(
                     progress.remove_task(upload_task)
 
                     # Stop all tasks that are not currently uploading
-                    _ = [
-                        progress.stop_task(x)
-                        for x in [y.id for y in progress.tasks if y.fields.get("step") != "put"]
-                    ]
+                    for ptask in progress.tasks:
+                        if ptask.fields.get("step") != "put":
+                            progress.stop_task(ptask.id)
 
 
 ###############################################################################
@@ -205,15 +223,33 @@ class DataPutter(base.DDSBaseClass):
             # Spinner while collecting file info
             wait_task = progress.add_task("Collecting and preparing data", step="prepare")
 
-            # Get file info
-            self.filehandler = fhl.LocalFileHandler(
-                user_input=(source, source_path_file),
-                project=self.project,
-                temporary_destination=self.dds_directory.directories["FILES"],
-            )
+            # Verify the Safespring S3 bucket while collecting local file
+            # info -- the two are independent and both I/O bound
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                bucket_future = executor.submit(self.verify_bucket_exist)
+
+                # Get file info
+                self.filehandler = fhl.LocalFileHandler(
+                    user_input=(source, source_path_file),
+                    project=self.project,
+                    temporary_destination=self.dds_directory.directories["FILES"],
+                )
 
-            # Verify that the Safespring S3 bucket exists
-            self.verify_bucket_exist()
+                bucket_future.result()
+
+            # Keep one S3 connection open and reuse it for all file uploads
+            self.s3connector = s3.S3Connector(project_id=self.project, token=self.token)
+            self.s3connector.connect()
+
+            # Pre-bind the per-delivery constant upload arguments
+            self.upload_file = None
+            if self.s3connector.resource is not None:
+                self.upload_file = functools.partial(
+                    self.s3connector.resource.meta.client.upload_file,
+                    Bucket=self.s3connector.bucketname,
+                    ExtraArgs=UPLOAD_EXTRA_ARGS,
+                    Config=UPLOAD_CONFIG,
+                )
 
             # Check which, if any, files exist in the db
             files_in_db = self.filehandler.check_previous_upload(token=self.token)
@@ -231,6 +267,10 @@ class DataPutter(base.DDSBaseClass):
                 existing_files=files_in_db, overwrite=self.overwrite
             )
 
+            # Index of files not yet started -- lets break-on-fail cancel
+            # pending files without rescanning the whole status dict
+            self.not_started = set(self.status)
+
             # Remove spinner
             progress.remove_task(wait_task)
 
@@ -271,12 +311,12 @@ class DataPutter(base.DDSBaseClass):
             file_public_key = encryptor.get_public_component_hex(private_key=encryptor.my_private)
             salt = encryptor.salt
 
-        LOG.debug(f"Updating file processed size: {file_info['path_processed']}")
+        LOG.debug("Updating file processed size: %s", file_info["path_processed"])
 
         # Update file info incl size, public key, salt
-        self.filehandler.data[file]["public_key"] = file_public_key
-        self.filehandler.data[file]["key_salt"] = salt
-        self.filehandler.data[file]["size_processed"] = file_info["path_processed"].stat().st_size
+        file_info["public_key"] = file_public_key
+        file_info["key_salt"] = salt
+        file_info["size_processed"] = file_info["path_processed"].stat().st_size
 
         if saved:
             LOG.info(
@@ -286,7 +326,7 @@ class DataPutter(base.DDSBaseClass):
             progress.reset(
                 task,
                 description=txt.TextHandler.task_name(file=file, step="put"),
-                total=self.filehandler.data[file]["size_processed"],
+                total=file_info["size_processed"],
                 step="put",
             )
 
@@ -299,7 +339,7 @@ class DataPutter(base.DDSBaseClass):
 
                 if db_updated:
                     all_ok = True
-                    LOG.info(f"File successfully uploaded and added to the database: {file}")
+                    LOG.info("File successfully uploaded and added to the database: %s", file)
 
         if not saved or all_ok:
             # Delete temporary processed file locally
@@ -322,47 +362,44 @@ class DataPutter(base.DDSBaseClass):
         error = ""
 
         # File info
-        file_local = str(self.filehandler.data[file]["path_processed"])
-        file_remote = self.filehandler.data[file]["path_remote"]
-
-        with s3.S3Connector(project_id=self.project, token=self.token) as conn:
-
-            # Check that connection ok and upload file
-            if None in [
-                conn.safespring_project,
-                conn.url,
-                conn.keys,
-                conn.bucketname,
-            ]:
-                error = "No s3 info returned! " + conn.message
-            else:
-                # Upload file
-                try:
-                    conn.resource.meta.client.upload_file(
-                        Filename=file_local,
-                        Bucket=conn.bucketname,
-                        Key=file_remote,
-                        ExtraArgs={
-                            "ACL": "private",  # Access control list
-                            "CacheControl": "no-store",  # Don't store cache
-                        },
-                        Callback=status.ProgressPercentage(
-                            progress=progress,
-                            task=task,
-                        )
-                        if task is not None
-                        else None,
+        file_info = self.filehandler.data[file]
+        file_local = str(file_info["path_processed"])
+        file_remote = file_info["path_remote"]
+
+        conn = self.s3connector
+
+        # Check that connection ok and upload file
+        if (
+            conn.safespring_project is None
+            or conn.url is None
+            or conn.keys is None
+            or conn.bucketname is None
+            or self.upload_file is None
+        ):
+            error = "No s3 info returned! " + conn.message
+        else:
+            # Upload file
+            try:
+                self.upload_file(
+                    Filename=file_local,
+                    Key=file_remote,
+                    Callback=status.ProgressPercentage(
+                        progress=progress,
+                        task=task,
                     )
-                except (
-                    botocore.client.ClientError,
-                    boto3.exceptions.Boto3Error,
-                    FileNotFoundError,
-                    TypeError,
-                ) as err:
-                    error = f"S3 upload of file '{file}' failed: {err}"
-                    LOG.exception(f"{file}: {err}")
-                else:
-                    uploaded = True
+                    if task is not None
+                    else None,
+                )
+            except (
+                botocore.client.ClientError,
+                boto3.exceptions.Boto3Error,
+                FileNotFoundError,
+                TypeError,
+            ) as err:
+                error = f"S3 upload of file '{file}' failed: {err}"
+                LOG.exception("%s: %s", file, err)
+            else:
+                uploaded = True
 
         return uploaded, error
 
@@ -389,13 +426,12 @@ class DataPutter(base.DDSBaseClass):
         }
 
         # Send file info to API - post if new file, put if overwrite
-        put_or_post = requests.put if fileinfo["overwrite"] else requests.post
+        put_or_post = self.session.put if fileinfo["overwrite"] else self.session.post
         try:
             response = put_or_post(
                 DDSEndpoint.FILE_NEW,
                 params=params,
                 json=file_info,
-                headers=self.token,
                 timeout=DDSEndpoint.TIMEOUT,
             )
         except requests.exceptions.RequestException as err:
@@ -409,8 +445,9 @@ class DataPutter(base.DDSBaseClass):
                 return added_to_db, error
 
             try:
-                added_to_db, error = (True, response.json().get("message"))
-            except simplejson.JSONDecodeError as err:
+                message = dds_cli.utils.get_json_response(response).get("message")
+                added_to_db, error = (True, message)
+            except dds_cli.utils.JSONDecodeError as err:
                 error = str(err)
                 LOG.warning(error)
 
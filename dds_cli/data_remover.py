@@ -13,10 +13,10 @@ import requests
 import rich
 import rich.table
 import rich.padding
-import simplejson
 
 # Own modules
 import dds_cli
+import dds_cli.utils
 from dds_cli.cli_decorators import removal_spinner
 from dds_cli import base
 from dds_cli import DDSEndpoint
@@ -102,8 +102,8 @@ class DataRemover(base.DDSBaseClass):
         """Remove all files in project."""
         # Perform request to API to perform deletion
         try:
-            response = requests.delete(
-                DDSEndpoint.REMOVE_PROJ_CONT, params={"project": self.project}, headers=self.token
+            response = self.session.delete(
+                DDSEndpoint.REMOVE_PROJ_CONT, params={"project": self.project}
             )
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
@@ -113,8 +113,8 @@ class DataRemover(base.DDSBaseClass):
 
         # Print out response - deleted or not?
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             raise SystemExit from err
 
         if "removed" not in resp_json:
@@ -127,11 +127,10 @@ class DataRemover(base.DDSBaseClass):
     def remove_file(self, files):
         """Remove specific files."""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 DDSEndpoint.REMOVE_FILE,
                 params={"project": self.project},
                 json=files,
-                headers=self.token,
             )
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
@@ -143,8 +142,8 @@ class DataRemover(base.DDSBaseClass):
 
         # Get info in response
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             raise SystemExit from err
 
         self.__create_failed_table(resp_json=resp_json)
@@ -153,11 +152,10 @@ class DataRemover(base.DDSBaseClass):
     def remove_folder(self, folder):
         """Remove specific folders."""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 DDSEndpoint.REMOVE_FOLDER,
                 params={"project": self.project},
                 json=folder,
-                headers=self.token,
             )
         except requests.exceptions.RequestException as err:
             raise SystemExit from err
@@ -170,8 +168,8 @@ class DataRemover(base.DDSBaseClass):
 
         # Make sure required info is returned
         try:
-            resp_json = response.json()
-        except simplejson.JSONDecodeError as err:
+            resp_json = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             raise SystemExit from err
 
         self.__create_failed_table(resp_json=resp_json, level="Folder")
@@ -62,7 +62,7 @@ class ECDHKeyHandler:
             backend=backends.default_backend(),
         ).derive(shared_key)
 
-        LOG.debug(f"Salt: {salt}")
+        LOG.debug("Salt: %s", salt)
         return derived_shared_key, salt.hex().upper()
 
     @staticmethod
@@ -267,7 +267,7 @@ class Decryptor(ECDHKeyHandler):
                 LOG.debug("Testing nonce...")
                 if last_nonce != nonce:
                     raise SystemExit("Nonces do not match!!")
-                LOG.debug(f"Last nonce should be: {last_nonce}, was: {nonce}")
+                LOG.debug("Last nonce should be: %s, was: %s", last_nonce, nonce)
         except Exception as err:
             LOG.warning(str(err))
         finally:
@@ -5,11 +5,10 @@
 ###############################################################################
 
 # Standard library
-import json
+import functools
 import logging
 import os
 import pathlib
-import textwrap
 
 # Installed
 import rich
@@ -24,6 +23,20 @@ import dds_cli.exceptions
 
 LOG = logging.getLogger(__name__)
 
+###############################################################################
+# FUNCTIONS ####################################################### FUNCTIONS #
+###############################################################################
+
+
+@functools.lru_cache(maxsize=8)
+def _read_source_path_file(path_str, mtime_ns):
+    """Read and split the source-path-file.
+
+    Cached on (path, mtime) so that repeated deliveries with the same file in
+    one process do not reread and reparse it."""
+    return pathlib.Path(path_str).read_text().splitlines()
+
+
 ###############################################################################
 # CLASSES ########################################################### CLASSES #
 ###############################################################################
@@ -44,41 +57,39 @@ class FileHandler:
             self.data_list += list(source)
         if source_path_file is not None:
             source_path_file = pathlib.Path(source_path_file)
-            if source_path_file.exists():
+            # Resolving stats every path component -- skip it for absolute paths
+            spf = source_path_file if source_path_file.is_absolute() else source_path_file.resolve()
+            if spf.is_file():
                 try:
-                    original_umask = os.umask(0)  # User file-creation mode mask
-                    with source_path_file.resolve().open(mode="r") as spf:
-                        self.data_list += spf.read().splitlines()
+                    self.data_list += _read_source_path_file(str(spf), spf.stat().st_mtime_ns)
                 except OSError as err:
-                    dds_cli.utils.console.print(
-                        f"Failed to get files from source-path-file option: {err}"
-                    )
-                    os.umask(original_umask)
-                    os._exit(1)
-                finally:
-                    os.umask(original_umask)
+                    raise dds_cli.exceptions.DDSCLIException(
+                        message=f"Failed to get files from source-path-file option: {err}"
+                    ) from err
 
         self.failed = {}
 
+        # Subpaths already created under local_destination during this run
+        self.created_subpaths = set()
+
     # Static methods ############ Static methods #
     @staticmethod
     def append_errors_to_file(file: pathlib.Path, info):
         """Save errors to specific json file."""
         try:
-            original_umask = os.umask(0)  # User file-creation mode mask
-            with file.open(mode="a") as errfile:
-                json_output = json.dumps(
-                    info,
-                    indent=None,
-                )
-                # Each line is valid json, but the entire file is not.
-                # Multiple threads are appending to this file, so valid json for
-                # the entire file is not trivial.
-                errfile.write(json_output + "\n")
+            # Each line is valid json, but the entire file is not. Multiple
+            # threads are appending to this file, so valid json for the entire
+            # file is not trivial -- O_APPEND with one write per entry keeps
+            # concurrent lines from interleaving. Passing the mode to os.open
+            # replaces the old process-wide (and thread-unsafe) umask dance.
+            payload = dds_cli.utils.json_dumps(info) + b"\n"
+            fd = os.open(str(file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
         except (OSError, TypeError) as err:
             LOG.warning(str(err))
-        finally:
-            os.umask(original_umask)
 
     @staticmethod
     def create_summary_table(
@@ -114,7 +125,7 @@ class FileHandler:
                 "To ignore issues with other files, remove the `--break-on-fail` "
                 "flag from the call."
             )
-            if any([1 for x in files if "break-on-fail" in x[1]["message"]])
+            if any("break-on-fail" in x[1]["message"] for x in files)
             else ""
         )
 
@@ -131,73 +142,71 @@ class FileHandler:
 
             if get_single_files:
                 if upload:
-                    _ = [
+                    for x in files:
+                        info = x[1]
+                        message = info["message"]
                         curr_table.add_row(
-                            textwrap.fill(x[1]["path_raw"]),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
+                            info["path_raw"],
+                            message if "break-on-fail" not in message else "",
                         )
-                        for x in files
-                    ]
                 else:
-                    _ = [
+                    for x in files:
+                        info = x[1]
+                        message = info["message"]
                         curr_table.add_row(
-                            x[1]["name_in_db"],
-                            textwrap.fill(x[0]),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
+                            info["name_in_db"],
+                            x[0],
+                            message if "break-on-fail" not in message else "",
                         )
-                        for x in files
-                    ]
             else:
                 subpath = ""
                 if upload:
                     for x in files:
+                        info = x[1]
+                        message = info["message"]
+                        row_subpath = info["subpath"]
+                        # PurePath is enough here -- the raw path is only split,
+                        # never touched on disk
+                        path_raw = pathlib.PurePath(info["path_raw"])
                         curr_table.add_row(
-                            textwrap.fill(
-                                ""
-                                if subpath == x[1]["subpath"]
-                                else str(pathlib.Path(x[1]["path_raw"]).parent)
-                            ),
-                            str(pathlib.Path(x[1]["path_raw"]).name),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
+                            "" if subpath == row_subpath else str(path_raw.parent),
+                            path_raw.name,
+                            message if "break-on-fail" not in message else "",
                         )
 
-                        subpath = x[1]["subpath"]
+                        subpath = row_subpath
                 else:
                     for x in files:
+                        info = x[1]
+                        message = info["message"]
+                        row_subpath = info["subpath"]
                         curr_table.add_row(
-                            ""
-                            if subpath == x[1]["subpath"]
-                            else str(pathlib.Path(x[1]["subpath"])),
-                            x[1]["name_in_db"],
-                            textwrap.fill(str(pathlib.Path(x[0]))),
-                            x[1]["message"] if "break-on-fail" not in x[1]["message"] else "",
+                            "" if subpath == row_subpath else str(pathlib.PurePath(row_subpath)),
+                            info["name_in_db"],
+                            str(pathlib.PurePath(x[0])),
+                            message if "break-on-fail" not in message else "",
                         )
 
-                        subpath = x[1]["subpath"]
+                        subpath = row_subpath
 
         return curr_table, additional_message
 
     @staticmethod
     def delete_tempdir(directory: pathlib.Path):
         """Delete the specified directory."""
-        ok_to_remove = False
-
         # If file not ok to remove folder
         if not directory.is_dir():
-            return ok_to_remove
-
-        # Iterate through any existing subdirectories - recursive
-        LOG.debug(f"Any in directory? {any(directory.iterdir())}")
-        for x in directory.iterdir():
-            LOG.debug(x)
-        if any(directory.iterdir()):
-            for p in directory.iterdir():
-                if p.is_dir():
-                    ok_to_remove = FileHandler.delete_tempdir(directory=p)
-                    if ok_to_remove:
-                        directory.rmdir()
-        else:
-            directory.rmdir()
-            ok_to_remove = True
-
-        return ok_to_remove
+            return False
+
+        # Walk the tree bottom-up and remove every directory that has become
+        # empty -- one scan per directory instead of the repeated iterdir
+        # passes of the old recursion. Directories that still hold files are
+        # left alone, so only empty structure is cleaned away.
+        for root, _, _ in os.walk(directory, topdown=False):
+            try:
+                os.rmdir(root)
+            except OSError:
+                LOG.debug("Not empty, keeping directory: %s", root)
+
+        # Removal succeeded if the top directory itself is gone
+        return not directory.is_dir()
@@ -15,7 +15,6 @@ import sys
 
 # Installed
 import requests
-import simplejson
 
 # Own modules
 from dds_cli import DDSEndpoint
@@ -71,8 +70,7 @@ class LocalFileHandler(fh.FileHandler):
 
         # No data -- cannot proceed
         if not self.data_list:
-            dds_cli.utils.console.print("\n:warning-emoji: No data specified. :warning-emoji:\n")
-            os._exit(1)
+            raise exceptions.UploadError("No data specified.")
 
         self.data, _ = self.__collect_file_info_local(all_paths=self.data_list)
         self.data_list = None
@@ -127,7 +125,7 @@ class LocalFileHandler(fh.FileHandler):
 
                     if error != "":
                         LOG.exception(error)
-                        os._exit(1)
+                        raise exceptions.UploadError(error)
 
                 path_processed = self.create_encrypted_name(
                     raw_file=path,
@@ -180,37 +178,31 @@ class LocalFileHandler(fh.FileHandler):
 
         LOG.debug("Creating the status dictionary.")
 
-        status_dict = {}
-        for x in list(self.data):
-            in_db = bool(x in existing_files)
-            if in_db and not overwrite:
+        # Files found in the db are either failed or marked for overwrite
+        in_db = self.data.keys() & existing_files.keys()
+        if overwrite:
+            for x in in_db:
+                self.data[x].update({"overwrite": True, "path_remote": existing_files[x]})
+        else:
+            for x in in_db:
                 self.failed[x] = {
                     **self.data.pop(x),
                     **{"message": "File already uploaded"},
                 }
-            else:
-                if in_db:
-                    if overwrite:
-                        self.data[x].update(
-                            {
-                                "overwrite": True,
-                                "path_remote": existing_files[x],
-                            }
-                        )
 
-                # filestream_funcname = (
-                #     "read_file" if self.data[x]["compressed"] else "compress_file"
-                # )
-                status_dict[x] = {
-                    "cancel": False,
-                    "started": False,
-                    "message": "",
-                    "failed_op": None,
-                    # filestream_funcname: {"started": False, "done": False},
-                    "put": {"started": False, "done": False},
-                    "add_file_db": {"started": False, "done": False},
-                    # "task": None,
-                }
+        status_dict = {
+            x: {
+                "cancel": False,
+                "started": False,
+                "message": "",
+                "failed_op": None,
+                "put_started": False,
+                "put_done": False,
+                "add_file_db_started": False,
+                "add_file_db_done": False,
+            }
+            for x in self.data
+        }
 
         LOG.debug("Initial statuses created.")
 
@@ -243,17 +235,14 @@ class LocalFileHandler(fh.FileHandler):
             raise exceptions.DDSCLIException(message=f"{message}: {response.json().get('message')}")
 
         try:
-            files_in_db = response.json()
-        except simplejson.JSONDecodeError as err:
+            files_in_db = dds_cli.utils.get_json_response(response)
+        except dds_cli.utils.JSONDecodeError as err:
             LOG.warning(err)
             raise SystemExit from err
 
         # API failure
         if "files" not in files_in_db:
-            dds_cli.utils.console.print(
-                "\n:warning-emoji: Files not returned from API. :warning-emoji:\n"
-            )
-            os._exit(1)
+            raise exceptions.DDSCLIException(message="Files not returned from API.")
 
         LOG.debug("Previous upload check finished.")
 
@@ -3,12 +3,12 @@ import logging
 
 # Installed
 import requests
-import simplejson
 
 # Own modules
 from dds_cli import base
 from dds_cli import exceptions
 from dds_cli import DDSEndpoint
+import dds_cli.utils
 
 ###############################################################################
 # START LOGGING CONFIG ################################# START LOGGING CONFIG #
@@ -48,11 +48,11 @@ class ProjectCreator(base.DDSBaseClass):
         created_project_id = ""
         user_addition_statuses = {}
 
-        # Submit request to API
+        # Submit request to API -- the pooled session carries the auth token
+        # and reuses the TCP connection across subcommands
         try:
-            response = requests.post(
+            response = self.session.post(
                 DDSEndpoint.CREATE_PROJ,
-                headers=self.token,
                 json={
                     "title": title,
                     "description": description,
@@ -64,21 +64,25 @@ class ProjectCreator(base.DDSBaseClass):
         except requests.exceptions.RequestException as err:
             raise exceptions.ApiRequestError(message=str(err))
         else:
+            # Decode the body once and pick the fields out of it
+            try:
+                response_json = dds_cli.utils.get_json_response(response)
+            except dds_cli.utils.JSONDecodeError as err:
+                error = str(err)
+                LOG.warning(error)
+                return created, created_project_id, user_addition_statuses, error
+
             # Error if failed
             if not response.ok:
-                error = f"{response.json().get('message')}"
+                error = f"{response_json.get('message')}"
                 LOG.error(error)
                 return created, created_project_id, user_addition_statuses, error
 
-            try:
-                created, created_project_id, user_addition_statuses, error = (
-                    True,
-                    response.json().get("project_id"),
-                    response.json().get("user_addition_statuses"),
-                    response.json().get("message"),
-                )
-            except simplejson.JSONDecodeError as err:
-                error = str(err)
-                LOG.warning(error)
+            created, created_project_id, user_addition_statuses, error = (
+                True,
+                response_json.get("project_id"),
+                response_json.get("user_addition_statuses"),
+                response_json.get("message"),
+            )
 
         return created, created_project_id, user_addition_statuses, error
@@ -6,18 +6,19 @@
 
 # Standard library
 import dataclasses
+import functools
 import logging
-import os
 import requests
 import traceback
 
 # Installed
 import botocore
-import simplejson
 
 # Own modules
 from dds_cli import DDSEndpoint
+from dds_cli import exceptions
 from dds_cli.cli_decorators import connect_cloud
+import dds_cli.utils
 
 ###############################################################################
 # LOGGING ########################################################### LOGGING #
@@ -25,6 +26,39 @@ from dds_cli.cli_decorators import connect_cloud
 
 LOG = logging.getLogger(__name__)
 
+###############################################################################
+# FUNCTIONS ####################################################### FUNCTIONS #
+###############################################################################
+
+
+@functools.lru_cache(maxsize=8)
+def _request_s3_info(project_id, authorization):
+    """Request the S3 connection info from the API.
+
+    Cached per project and token for the process lifetime, so that repeated
+    S3Connector constructions do not redo the credential round trip."""
+    try:
+        response = requests.get(
+            DDSEndpoint.S3KEYS,
+            params={"project": project_id},
+            headers={"Authorization": authorization},
+            timeout=DDSEndpoint.TIMEOUT,
+        )
+    except requests.exceptions.RequestException as err:
+        LOG.warning(err)
+        raise SystemExit from err
+
+    # Error
+    assert (
+        response.ok
+    ), f"Failed retrieving Safespring project name. Server response: {response.text}"
+
+    try:
+        return dds_cli.utils.get_json_response(response)
+    except dds_cli.utils.JSONDecodeError as err:
+        raise SystemExit from err
+
+
 ###############################################################################
 # CLASSES ########################################################### CLASSES #
 ###############################################################################
@@ -53,9 +87,13 @@ class S3Connector:
         ) = self.get_s3_info(project_id=project_id, token=token)
 
     @connect_cloud
-    def __enter__(self):
+    def connect(self):
+        """Connect the S3 resource. Connection errors are saved in self.message."""
         return self
 
+    def __enter__(self):
+        return self.connect()
+
     def __exit__(self, exc_type, exc_value, tb):
         if exc_type is not None:
             traceback.print_exception(exc_type, exc_value, tb)
@@ -70,31 +108,11 @@ class S3Connector:
 
         sfsp_proj, keys, url, bucket, error = (None, None, None, None, "")
 
-        if None in [project_id, token]:
+        if project_id is None or token is None:
             raise Exception("Project information missing, cannot connect to cloud.")
 
-        # Perform request to API
-        try:
-            response = requests.get(
-                DDSEndpoint.S3KEYS,
-                params={"project": project_id},
-                headers=token,
-                timeout=DDSEndpoint.TIMEOUT,
-            )
-        except requests.exceptions.RequestException as err:
-            LOG.warning(err)
-            raise SystemExit from err
-
-        # Error
-        assert (
-            response.ok
-        ), f"Failed retrieving Safespring project name. Server response: {response.text}"
-
-        # Get s3 info
-        try:
-            s3info = response.json()
-        except simplejson.JSONDecodeError as err:
-            raise SystemExit from err
+        # Get s3 info -- cached after the first request for the project
+        s3info = _request_s3_info(project_id=project_id, authorization=token["Authorization"])
 
         if any(value is None for value in s3info.values()):
             error = "Response ok but s3 info missing."
@@ -124,24 +142,26 @@ class S3Connector:
         """Check that the bucketname restrictions are met."""
         bnlen = len(self.bucketname)
         if not 3 <= bnlen <= 63:
-            # Add custom exception
-            LOG.error(
-                f"Invalid bucket name length. Must be between 3 and 63 characters, found {bnlen}"
+            raise exceptions.DDSCLIException(
+                message=(
+                    f"Invalid bucket name length. Must be between 3 and 63 characters, "
+                    f"found {bnlen}"
+                )
             )
-            os._exit(0)
 
         if "_" in self.bucketname:
-            # Add custom exception
-            LOG.error(f"Invalid bucket name characters. Cannot contain underscores.")
-            os._exit(0)
+            raise exceptions.DDSCLIException(
+                message="Invalid bucket name characters. Cannot contain underscores."
+            )
 
-        bucketnamefirst = list(self.bucketname)[0]
+        bucketnamefirst = self.bucketname[0]
         if not (bucketnamefirst.islower() or bucketnamefirst.isdigit()):
-            # Add custom exception
-            LOG.error(
-                f"Invalid first character. Must be digit or lowercase letter, found '{bucketnamefirst}'",
+            raise exceptions.DDSCLIException(
+                message=(
+                    f"Invalid first character. Must be digit or lowercase letter, "
+                    f"found '{bucketnamefirst}'"
+                )
             )
-            os._exit(0)
 
     def create_bucket(self):
         """Creates the bucket"""
@@ -156,8 +176,9 @@ class S3Connector:
 
         bucket_exists = self.check_bucket_exists()
         if not bucket_exists:
-            print(f"Bucket '{self.bucketname}' does not exist. Failed second attempt.")
-            os._exit(0)
+            raise exceptions.DDSCLIException(
+                message=f"Bucket '{self.bucketname}' does not exist. Failed second attempt."
+            )
         LOG.info(f"Bucket '{self.bucketname}' created!")
 
         return True
@@ -52,16 +52,18 @@ class DeliveryStatus:
         """Cancel the failed file"""
 
 
-class ProgressPercentage(object):
-    """Updates the progress bar with the callback from boto3."""
+class ProgressPercentage:
+    """Updates the progress bar with the callback from boto3.
+
+    boto3 invokes the callback for every transferred chunk, so the instance
+    uses __slots__ to keep attribute access off the instance dict."""
+
+    __slots__ = ("progress", "task")
 
     def __init__(self, progress, task):
         self.progress = progress
         self.task = task
 
-        self._seen_so_far = 0
-
     def __call__(self, bytes_amount, **_):
 
-        self._seen_so_far += bytes_amount
         self.progress.update(self.task, advance=bytes_amount)
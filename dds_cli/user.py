@@ -10,15 +10,14 @@ import datetime
 import logging
 import os
 import requests
-import simplejson
 import stat
 
 # Installed
-import getpass
 import rich
 
 # Own modules
 import dds_cli
+import dds_cli.utils
 from dds_cli import exceptions
 
 ###############################################################################
@@ -93,6 +92,10 @@ class User:
         if self.username is None:
             self.username = rich.prompt.Prompt.ask("DDS username")
 
+        # Local import -- only the interactive path needs getpass and its
+        # terminal handling modules
+        import getpass
+
         password = getpass.getpass(prompt="DDS Password: ")
 
         if password == "":
@@ -107,10 +110,10 @@ class User:
                 auth=(self.username, password),
                 timeout=dds_cli.DDSEndpoint.TIMEOUT,
             )
-            response_json = response.json()
+            response_json = dds_cli.utils.get_json_response(response)
         except requests.exceptions.RequestException as err:
             raise exceptions.ApiRequestError(message=str(err)) from err
-        except simplejson.JSONDecodeError as err:
+        except dds_cli.utils.JSONDecodeError as err:
             raise dds_cli.exceptions.ApiResponseError(message=str(err))
 
         # Raise exceptions to log info if not ok response
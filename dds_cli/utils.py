@@ -1,30 +1,88 @@
-import rich.console
+import functools
 import numbers
 
+import rich.console
+
+try:
+    # orjson is a C-accelerated parser, several times faster than the stdlib
+    import orjson
+
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def json_dumps(obj):
+        """Serialize obj to JSON bytes."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+    def json_dumps(obj):
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj).encode()
+
+
 console = rich.console.Console()
 stderr_console = rich.console.Console(stderr=True)
 
+# The IEC created prefixes such as kibi, mebi, gibi, etc., to unambiguously denote powers of 1024
+_IEC_PREFIXES = ("", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi", "Yi")
+_UNIT_PREFIXES = ("", "K", "M", "G", "T", "P", "E", "Z", "Y")
+# The prefixes of the International System of Units (SI)
+_SI_PREFIXES = ("", "k", "M", "G", "T", "P", "E", "Z", "Y")
+# For currencies, the capital K is more common and Billions are used instead of Giga
+_CURRENCY_PREFIXES = ("", "K", "M", "B", "T", "P", "E", "Z", "Y")
 
-def calculate_magnitude(projects, keys, iec_standard=False):
-    """Uses the project list, obtains the values assigned to a particular key iteratively and calculates the best magnitude to format this set of values consistently"""
+# (prefixes, base, unit, spacer before prefix, spacer before unit) per
+# (column, iec_standard) pair
+_FORMAT_TABLE = {
+    ("Size", False): (_UNIT_PREFIXES, 1000.0, "B", " ", ""),
+    ("Size", True): (_IEC_PREFIXES, 1024.0, "B", " ", ""),
+    ("Usage", False): (_UNIT_PREFIXES, 1000.0, "Bh", " ", ""),
+    ("Usage", True): (_IEC_PREFIXES, 1024.0, "Bh", " ", ""),
+    ("Cost", False): (_CURRENCY_PREFIXES, 1000.0, "SEK", "", " "),
+    ("Cost", True): (_CURRENCY_PREFIXES, 1000.0, "SEK", "", " "),
+}
+_DEFAULT_NUMBER_FORMAT = (_SI_PREFIXES, 1000.0, "", "", " ")
 
-    # initialize the dictionary to be returned
-    magnitudes = dict(zip(keys, [None] * len(keys)))
 
-    for key in keys:
+def get_json_response(response):
+    """Decode the body of an API response. Raises JSONDecodeError if invalid."""
+    return json_loads(response.content)
 
-        values = [proj[key] for proj in projects]
 
-        if all(isinstance(x, numbers.Number) for x in values):
+def calculate_magnitude(projects, keys, iec_standard=False):
+    """Uses the project list, obtains the values assigned to a particular key iteratively and calculates the best magnitude to format this set of values consistently"""
 
-            if key in ["Size", "Usage"] and iec_standard:
-                base = 1024.0
-            else:
-                base = 1000.0
+    # initialize the dictionary to be returned
+    magnitudes = dict.fromkeys(keys)
+
+    # Track per key whether every value is numeric and the smallest value that
+    # reaches the base -- one pass over the projects instead of one per key
+    all_numeric = dict.fromkeys(keys, True)
+    minimums = dict.fromkeys(keys)
+    bases = {key: 1024.0 if key in ["Size", "Usage"] and iec_standard else 1000.0 for key in keys}
+
+    for proj in projects:
+        for key in keys:
+            value = proj[key]
+            if not isinstance(value, numbers.Number):
+                all_numeric[key] = False
+            elif value >= bases[key]:
+                # exclude values smaller than base, such that empty projects
+                # don't interfer with the calculation
+                minimum = minimums[key]
+                if minimum is None or value < minimum:
+                    minimums[key] = value
 
-            # exclude values smaller than base, such that empty projects don't interfer with the calculation
+    for key in keys:
+        if all_numeric[key]:
+            base = bases[key]
             # ensures that a minimum can be calculated if no val is larger than base
-            minimum = (lambda x: min(x) if x else 1)([val for val in values if val >= base])
+            minimum = minimums[key] if minimums[key] is not None else 1
             mag = 0
 
             while abs(minimum) >= base:
@@ -41,61 +99,42 @@ def format_api_response(response, key, magnitude=None, iec_standard=False):
         return response  # pass the response if already a string
 
     if isinstance(response, numbers.Number):
-        response = float("{:.3g}".format(response))
-        mag = 0
-
-        if key in ["Size", "Usage"]:
-            if iec_standard:
-                # The IEC created prefixes such as kibi, mebi, gibi, etc., to unambiguously denote powers of 1024
-                prefixlist = ["", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi", "Yi"]
-                base = 1024.0
-            else:
-                prefixlist = ["", "K", "M", "G", "T", "P", "E", "Z", "Y"]
-                base = 1000.0
-            spacerA = " "
-            spacerB = ""
-        else:
-            # Default to the prefixes of the International System of Units (SI)
-            prefixlist = ["", "k", "M", "G", "T", "P", "E", "Z", "Y"]
-            base = 1000.0
-            spacerA = ""
-            spacerB = " "
-
-        if not magnitude:
-            # calculate a suitable magnitude if not given
-            while abs(response) >= base:
-                mag += 1
-                response /= base
-        else:
-            # utilize the given magnitude
-            response /= base ** magnitude
-
-        if key == "Size":
-            unit = "B"  # lock
-        elif key == "Usage":
-            unit = "Bh"  # arrow up
-        elif key == "Cost":
-            unit = "SEK"
-            prefixlist[1] = "K"  # for currencies, the capital K is more common.
-            prefixlist[3] = "B"  # for currencies, Billions are used instead of Giga
-
-        if response > 0:
-            if (
-                magnitude
-            ):  # if magnitude was given, then use fixed number of digits to allow for easier comparisons across projects
-                return "{}{}{}".format(
-                    "{:.2f}".format(response),
-                    spacerA,
-                    prefixlist[magnitude] + spacerB + unit,
-                )
-            else:  # if values are anyway prefixed individually, then strip trailing 0 for readability
-                return "{}{}{}".format(
-                    "{:.2f}".format(response).rstrip("0").rstrip("."),
-                    spacerA,
-                    prefixlist[mag] + spacerB + unit,
-                )
-        else:
-            return f"0 {unit}"
+        # Tables repeat the same values over and over -- format each distinct
+        # cell value only once
+        return _format_number(response, key, magnitude, iec_standard)
+
+    # Since table.add.row() expects a string, try to return whatever is not yet a string but also not numeric as string
+    return str(response)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_number(response, key, magnitude, iec_standard):
+    """Format a numeric value with a unit prefix. Cached by value and key."""
+    # One lookup replaces the per-call branch chain and prefix-list mutation
+    prefixlist, base, unit, spacerA, spacerB = _FORMAT_TABLE.get(
+        (key, bool(iec_standard)), _DEFAULT_NUMBER_FORMAT
+    )
+
+    # Empty cells need no rounding or magnitude work
+    if response <= 0:
+        return f"0 {unit}"
+
+    response = float("{:.3g}".format(response))
+    mag = 0
+
+    if not magnitude:
+        # calculate a suitable magnitude if not given
+        while abs(response) >= base:
+            mag += 1
+            response /= base
     else:
-        # Since table.add.row() expects a string, try to return whatever is not yet a string but also not numeric as string
-        return str(response)
+        # utilize the given magnitude
+        response /= base**magnitude
+
+    if magnitude:
+        # if magnitude was given, then use fixed number of digits to allow
+        # for easier comparisons across projects
+        return f"{response:.2f}{spacerA}{prefixlist[magnitude]}{spacerB}{unit}"
+    # if values are anyway prefixed individually, then strip trailing 0 for readability
+    number = f"{response:.2f}".rstrip("0").rstrip(".")
+    return f"{number}{spacerA}{prefixlist[mag]}{spacerB}{unit}"